@@ -4,9 +4,7 @@ Changelog Keeper Application Layer - main entrypoint
 import sys
 from typing import List
 from changelog_keeper.cli import cli
-from changelog_keeper.keeper import ChangelogKeeper, ChangelogKeeperError
-from changelog_keeper.model import Config, ModelError
-from changelog_keeper.parser import ParserException
+from changelog_keeper.model import Config
 
 
 class App:
@@ -19,11 +17,10 @@ class App:
     - assigning the exit code based on the caught exception
     """
 
-    ERROR_MSG = "ERROR: {0!s}"
     ERROR_CODES = {
-        ModelError: 3,
-        ParserException: 4,
-        ChangelogKeeperError: 5,
+        "ModelError": 3,
+        "ParserException": 4,
+        "ChangelogKeeperError": 5,
     }
 
     def __init__(self, arguments: List[str]):
@@ -34,14 +31,19 @@ class App:
         Main run method:
         - runs a Service
         - catches any exception raised, prints its message and returns an exit code
+        The service layer (and the parser behind it) is imported only when needed, so
+        that the CLI routine does not pay for loading it.
         """
+        # pylint: disable=import-outside-toplevel
         exit_code = 0
         try:
+            from changelog_keeper.keeper import ChangelogKeeper
+
             keeper: ChangelogKeeper = ChangelogKeeper(self.config)
             keeper.run()
         except BaseException as exc:  # pylint: disable=broad-exception-caught
-            print(App.ERROR_MSG.format(exc))
-            exit_code = App.ERROR_CODES.get(type(exc), 1)
+            print(f"ERROR: {exc!s}")
+            exit_code = App.ERROR_CODES.get(type(exc).__name__, 1)
         return exit_code
 
 
@@ -1,10 +1,10 @@
 """
 Changelog Keeper CLI - converts CLI arguments into Config object.
 """
-from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 from sys import exit  # pylint: disable=redefined-builtin
-from typing import List
+from typing import List, Optional
 from changelog_keeper.model import ChangeType, DEFAULT_CHANGELOG_PATH, Config, Operation
 
 #######################################################################################
@@ -13,6 +13,7 @@ from changelog_keeper.model import ChangeType, DEFAULT_CHANGELOG_PATH, Config, O
 
 ENTRYPOINT_COMMAND = "clkpr"
 DESCRIPTION = "Command line utility for keeping your changelog tidy"
+CHANGE_TYPE_VALUES = ", ".join(change_type.value.lower() for change_type in ChangeType)
 SUBPARSERS_META = {"title": "operations", "dest": "operation"}
 VERSION_ARGUMENT = (
     ("version",),
@@ -29,24 +30,136 @@ FILE_ARGUMENT = (
         "metavar": "PATH",
         "help": (
             "path to CHANGELOG file that will be read/written during the operation. "
-            f"Default: {str(DEFAULT_CHANGELOG_PATH)}"
+            f"Default: {DEFAULT_CHANGELOG_PATH}"
         ),
     },
 )
 
+# Fast path: positional arguments of every operation and supported options
+OPERATIONS = {operation.value: operation for operation in Operation}
+OPERATION_ARGUMENTS = {
+    Operation.CREATE: (),
+    Operation.ADD: ("change_type", "entry"),
+    Operation.CHECK: (),
+    Operation.RELEASE: ("version",),
+    Operation.YANK: ("version",),
+}
+FILE_OPTIONS = ("-f", "--file")
+REFERENCE_OPTIONS = ("-r", "--ref", "--reference")
+
+#######################################################################################
+### Fast path (considered to be 'private')
+#######################################################################################
+
+
+def _is_option(token: str) -> bool:
+    return token.startswith("-") and token != "-"
+
+
+def _cli_fast(arguments: List[str]) -> Optional[Config]:
+    # pylint: disable=too-many-branches,too-many-return-statements
+    """
+    Converts well-formed CLI arguments into Config object without building the
+    argparse parser. Returns None whenever the arguments are not trivially valid (help,
+    unknown or incomplete options, wrong number of positionals, etc.), so that argparse
+    can handle them and report errors exactly as before.
+    """
+    operation: Optional[Operation] = None
+    values = {"file": DEFAULT_CHANGELOG_PATH, "repo_ref": None}
+    positionals = []
+    tokens = iter(arguments)
+    for token in tokens:
+        if token in FILE_OPTIONS or token in REFERENCE_OPTIONS:
+            value = next(tokens, None)
+            if operation is None or value is None or _is_option(value):
+                return None
+            if token in FILE_OPTIONS:
+                values["file"] = Path(value)
+            elif operation == Operation.RELEASE:
+                values["repo_ref"] = value
+            else:
+                return None
+        elif _is_option(token):
+            return None
+        elif operation is None:
+            operation = OPERATIONS.get(token)
+            if operation is None:
+                return None
+        else:
+            positionals.append(token)
+
+    if operation is None or len(positionals) != len(OPERATION_ARGUMENTS[operation]):
+        return None
+    values.update(zip(OPERATION_ARGUMENTS[operation], positionals))
+    if "change_type" in values:
+        try:
+            values["change_type"] = ChangeType(values["change_type"])
+        except ValueError:
+            return None
+    return Config(
+        operation=operation,
+        change_type=values.get("change_type"),
+        entry=values.get("entry"),
+        version=values.get("version"),
+        repo_ref=values["repo_ref"],
+        file=values["file"],
+    )
+
+
+#######################################################################################
+### Argparse (considered to be 'private')
+#######################################################################################
+
+
+@lru_cache(maxsize=None)
+def _parser_class():
+    """
+    Returns an ArgumentParser subclass that reuses a single formatter to validate added
+    arguments, instead of creating a new one for each add_argument call (every
+    formatter queries the terminal size and, on Python 3.14+, the color settings).
+    Defined lazily, as argparse is only imported when the fast path gives up.
+    """
+    # pylint: disable=import-outside-toplevel
+    from argparse import ArgumentParser
+
+    class CliArgumentParser(ArgumentParser):
+        # pylint: disable=missing-function-docstring
+        """ArgumentParser caching the formatter used for arguments validation"""
+
+        _cached_formatter = None
+
+        def _get_validation_formatter(self):
+            if self._cached_formatter is None:
+                self._cached_formatter = super()._get_formatter()
+            return self._cached_formatter
+
+        def add_argument(self, *args, **kwargs):
+            self._get_formatter = self._get_validation_formatter
+            try:
+                return super().add_argument(*args, **kwargs)
+            finally:
+                del self._get_formatter
+
+    return CliArgumentParser
+
+
 #######################################################################################
 ### Subcommands (considered to be 'private')
 #######################################################################################
 
 
-def _cli_create(subparsers):
+def _cli_create(subparsers, parents):
     help_msg = "Generates new CHANGELOG file"
-    return subparsers.add_parser("create", help=help_msg, description=help_msg)
+    return subparsers.add_parser(
+        "create", help=help_msg, description=help_msg, parents=parents
+    )
 
 
-def _cli_add(subparsers):
+def _cli_add(subparsers, parents):
     help_msg = "Adds new entry to CHANGELOG file"
-    add = subparsers.add_parser("add", help=help_msg, description=help_msg)
+    add = subparsers.add_parser(
+        "add", help=help_msg, description=help_msg, parents=parents
+    )
     add.add_argument(
         "change_type",
         action="store",
@@ -54,8 +167,7 @@ def _cli_add(subparsers):
         metavar="CHANGE_TYPE",
         help=(
             "case insensitive. Type of change and section to be used in the "
-            "changelog. Supported values: "
-            f"{', '.join([str(ct.value).lower() for ct in list(ChangeType)])}"
+            f"changelog. Supported values: {CHANGE_TYPE_VALUES}"
         ),
     )
     add.add_argument(
@@ -68,12 +180,14 @@ def _cli_add(subparsers):
     return add
 
 
-def _cli_check(subparsers):
+def _cli_check(subparsers, parents):
     help_msg = "Validates CHANGELOG file"
-    return subparsers.add_parser("check", help=help_msg, description=help_msg)
+    return subparsers.add_parser(
+        "check", help=help_msg, description=help_msg, parents=parents
+    )
 
 
-def _cli_release(subparsers):
+def _cli_release(subparsers, parents):
     help_msg = "Releases a version within CHANGELOG file"
     version_kwargs = {
         "help": (
@@ -82,7 +196,9 @@ def _cli_release(subparsers):
         )
     }
     version_kwargs.update(VERSION_ARGUMENT[1])
-    release = subparsers.add_parser("release", help=help_msg, description=help_msg)
+    release = subparsers.add_parser(
+        "release", help=help_msg, description=help_msg, parents=parents
+    )
     release.add_argument(*VERSION_ARGUMENT[0], **version_kwargs)
     release.add_argument(
         "-r",
@@ -100,7 +216,7 @@ def _cli_release(subparsers):
     return release
 
 
-def _cli_yank(subparsers):
+def _cli_yank(subparsers, parents):
     help_msg = "Yanks already released version within CHANGELOG file"
     version_kwargs = {
         "help": (
@@ -109,7 +225,9 @@ def _cli_yank(subparsers):
         )
     }
     version_kwargs.update(VERSION_ARGUMENT[1])
-    yank = subparsers.add_parser("yank", help=help_msg, description=help_msg)
+    yank = subparsers.add_parser(
+        "yank", help=help_msg, description=help_msg, parents=parents
+    )
     yank.add_argument(*VERSION_ARGUMENT[0], **version_kwargs)
     return yank
 
@@ -119,16 +237,18 @@ def _cli_yank(subparsers):
 #######################################################################################
 
 
-def cli(arguments: List[str]) -> Config:
-    """
-    Converts CLI arguments into Config object.
-    """
+def _cli_argparse(arguments: List[str]) -> Config:
     sub_cmds = (_cli_create, _cli_add, _cli_check, _cli_release, _cli_yank)
-    parser = ArgumentParser(ENTRYPOINT_COMMAND, description=DESCRIPTION, add_help=True)
-    parser.add_argument(*FILE_ARGUMENT[0], **FILE_ARGUMENT[1])
+    parser_class = _parser_class()
+    file_parent = parser_class(add_help=False)
+    file_parent.add_argument(*FILE_ARGUMENT[0], **FILE_ARGUMENT[1])
+    parents = [file_parent]
+    parser = parser_class(
+        ENTRYPOINT_COMMAND, description=DESCRIPTION, add_help=True, parents=parents
+    )
     subparsers = parser.add_subparsers(**SUBPARSERS_META)
     for subcommand in sub_cmds:
-        subcommand(subparsers).add_argument(*FILE_ARGUMENT[0], **FILE_ARGUMENT[1])
+        subcommand(subparsers, parents)
 
     args = parser.parse_args(arguments[1:])
     if not args.operation:  # pragma: no cover
@@ -142,3 +262,13 @@ def cli(arguments: List[str]) -> Config:
         repo_ref=getattr(args, "repo_ref", None),
         file=args.file,
     )
+
+
+def cli(arguments: List[str]) -> Config:
+    """
+    Converts CLI arguments into Config object.
+    Well-formed arguments are handled by a lightweight fast path, everything else
+    (help messages, invalid arguments) falls back to the argparse based parser.
+    """
+    config = _cli_fast(arguments[1:])
+    return config if config is not None else _cli_argparse(arguments)
@@ -1,7 +1,7 @@
 """
 Keeper Service Layer - This file stores main logic implementation.
 """
-from typing import Tuple
+from typing import Dict, Tuple
 from changelog_keeper.model import (
     Changelog,
     Config,
@@ -28,6 +28,12 @@ class ChangelogKeeper:
     """
 
     DEFAULT_HEADER: Tuple[str, ...] = ["# Changelog", ""]
+    OPERATION_HANDLERS: Dict[Operation, str] = {
+        Operation.ADD: "_add",
+        Operation.CHECK: "_check",
+        Operation.RELEASE: "_release",
+        Operation.YANK: "_yank",
+    }
 
     def __init__(self, config: Config):
         self.config = config
@@ -49,7 +55,8 @@ class ChangelogKeeper:
             changelog: Changelog = ChangelogParser.load(self.config.file)
             if self.config.operation != Operation.CHECK:
                 self._check(changelog)
-            getattr(self, "_" + str(self.config.operation.value).lower())(changelog)
+            handler = ChangelogKeeper.OPERATION_HANDLERS[self.config.operation]
+            getattr(self, handler)(changelog)
         ChangelogParser.save(changelog, self.config.file)
 
     def _create(self) -> Changelog:
@@ -67,11 +74,7 @@ class ChangelogKeeper:
             raise ChangelogKeeperError(
                 "Unreleased version is not a first version in the changelog"
             )
-        release_states = {False: 0, True: 0}
-        correct_state = {False: 1, True: len(changelog) - 1}
-        for version in changelog:
-            release_states[version.is_released] += 1
-        if release_states != correct_state:
+        if changelog.unreleased_count != 1:
             raise ChangelogKeeperError("There has to be exactly one unreleased version")
 
     def _add(self, changelog: Changelog):
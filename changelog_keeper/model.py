@@ -1,19 +1,20 @@
 """
 Changelog Keeper Model - stores all model classes used in the entire application.
 """
-from collections import deque
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Deque, Dict, Optional, Set, Tuple, Union, List
+from sys import intern, version_info
+from typing import Dict, Optional, Set, Tuple, Union, List
 
 #######################################################################################
 ### Constants & utilities
 #######################################################################################
 
 DEFAULT_CHANGELOG_PATH = Path("./CHANGELOG.md")
-UNRELEASED_VERSION_NAME = "Unreleased"
+UNRELEASED_VERSION_NAME = intern("Unreleased")
+DATACLASS_SLOTS = {"slots": True} if version_info >= (3, 10) else {}
 
 
 def missing_enum(cls, value, func):
@@ -22,11 +23,7 @@ def missing_enum(cls, value, func):
     Applies an arbitrary function and checks whether a changed value is a member of an
     enum.
     """
-    value = func(value)
-    for member in cls:
-        if member.value == value:
-            return member
-    return None
+    return cls._value2member_map_.get(func(value))  # pylint: disable=protected-access
 
 
 class ModelError(BaseException):
@@ -50,7 +47,7 @@ class ChangeType(Enum):
 
     @classmethod
     def _missing_(cls, value: str):
-        return missing_enum(cls, value, lambda x: x.capitalize())
+        return missing_enum(cls, value, str.capitalize)
 
 
 class VersionPhase(IntEnum):
@@ -66,35 +63,18 @@ class VersionPhase(IntEnum):
 
 
 class VersionState:
-    # pylint: disable=missing-function-docstring
+    # pylint: disable=too-few-public-methods
     """
     State of a version. The object of this class handles and validates all operations
     that can be performed on a version instance.
     """
 
-    _name: str
+    __slots__ = ("name", "ref", "release_date", "phase")
 
-    @property
-    def name(self) -> str:
-        return self._name
-
-    _reference: Optional[str]
-
-    @property
-    def ref(self) -> Optional[str]:
-        return self._reference
-
-    _release_date: Optional[datetime]
-
-    @property
-    def release_date(self) -> Optional[datetime]:
-        return self._release_date
-
-    _phase: VersionPhase
-
-    @property
-    def phase(self) -> VersionPhase:
-        return self._phase
+    name: str
+    ref: Optional[str]
+    release_date: Optional[datetime]
+    phase: VersionPhase
 
     def __init__(
         self,
@@ -103,16 +83,16 @@ class VersionState:
         release_date: Optional[datetime],
         is_yanked: bool,
     ):
-        self._name = name
-        self._phase = VersionPhase(bool(release_date is not None))
+        self.name = name
+        self.phase = VersionPhase(release_date is not None)
         if is_yanked:
             self._validate_unreleased()
-            self._phase = VersionPhase.YANKED
-        self._reference = reference
-        self._release_date = release_date
+            self.phase = VersionPhase.YANKED
+        self.ref = reference
+        self.release_date = release_date
 
     def __eq__(self, __o: object) -> bool:
-        return (
+        return self is __o or (
             isinstance(__o, VersionState)
             and (self.name == __o.name)
             and (self.ref == __o.ref)
@@ -124,27 +104,30 @@ class VersionState:
         )
 
     def _release(self, version: str, ref_name: Optional[str]):
-        if bool(self._phase):
+        if self.phase:
             raise ModelError(
-                f"Released or yanked version cannot be released: {self._name}"
+                f"Released or yanked version cannot be released: {self.name}"
             )
-        self._name = version
-        self._reference = ref_name
-        self._release_date = datetime.now()
-        self._phase = VersionPhase.RELEASED
+        self.name = version
+        self.ref = ref_name
+        self.release_date = datetime.now()
+        self.phase = VersionPhase.RELEASED
 
     def _yank(self):
         self._validate_unreleased()
-        self._phase = VersionPhase.YANKED
+        self.phase = VersionPhase.YANKED
 
     def _validate_unreleased(self):
-        if not bool(self._phase):
-            raise ModelError(f"Unreleased version cannot be yanked: {self._name}")
+        if not self.phase:
+            raise ModelError(f"Unreleased version cannot be yanked: {self.name}")
 
 
 class Version:
     # pylint: disable=protected-access,missing-function-docstring
     """Changelog version representation"""
+
+    __slots__ = ("_state", "_is_released", "_changes")
+
     _state: VersionState
 
     @property
@@ -157,19 +140,21 @@ class Version:
 
     @ref.setter
     def ref(self, reference: Optional[str]):
-        self._state._reference = reference
+        self._state.ref = reference
 
     @property
     def release_date(self) -> Optional[datetime]:
         return self._state.release_date
 
+    _is_released: bool
+
     @property
     def is_released(self) -> bool:
-        return bool(self._state.phase)
+        return self._is_released
 
     @property
     def is_yanked(self) -> bool:
-        return bool(self._state.phase == VersionPhase.YANKED)
+        return self._state.phase == VersionPhase.YANKED
 
     _changes: Dict[ChangeType, Set[Tuple[str, ...]]]
 
@@ -185,28 +170,41 @@ class Version:
         is_yanked: bool,
     ):
         self._state = VersionState(name, reference, release_date, is_yanked)
+        self._is_released = bool(self._state.phase)
         self._changes = {}
 
     def __eq__(self, __o: object) -> bool:
-        return (
+        return self is __o or (
             isinstance(__o, Version)
             and self._state == __o._state
             and self._changes == __o._changes
         )
 
+    def clone(self) -> "Version":
+        version = Version(self.name, self.ref, self.release_date, self.is_yanked)
+        version._changes = {
+            change_type: set(entries) for change_type, entries in self._changes.items()
+        }
+        return version
+
     def _add_entry(self, change_type: ChangeType, entry: Tuple[str, ...]):
         if self.is_released:
             raise ModelError(
                 "Cannot modify changes for released or yanked version: "
                 f"{self._state.name}"
             )
-        self._changes.setdefault(change_type, set()).add(entry)
+        entries = self._changes.get(change_type)
+        if entries is None:
+            entries = self._changes[change_type] = set()
+        entries.add(entry)
 
     def _release(self, version: str, ref_name: Optional[str]):
         self._state._release(version, ref_name)
+        self._is_released = True
 
     def _yank(self):
         self._state._yank()
+        self._is_released = True
 
 
 class Changelog:
@@ -214,34 +212,45 @@ class Changelog:
     """Changelog representation"""
     header: List[str]
 
-    _versions: Deque[Version]
+    _versions: List[Version]
 
     @property
     def versions(self) -> Tuple[Version]:
+        """Snapshot of all versions. Iterate over the changelog to avoid the copy."""
         return tuple(self._versions)
 
     _names: Dict[str, Version]
 
     _refs: Dict[str, Version]
 
+    _keys: Set[str]
+
+    _unreleased_count: int
+
+    @property
+    def unreleased_count(self) -> int:
+        return self._unreleased_count
+
     rest: List[str]
 
     def __init__(self):
         super().__init__()
         self.header = []
-        self._versions = deque()
+        self._versions = []
         self._names = {}
         self._refs = {}
+        self._keys = set()
+        self._unreleased_count = 0
         self.rest = []
 
     def __contains__(self, name: str) -> bool:
-        return name in self._names or name in self._refs
+        return name in self._keys
 
     def __len__(self) -> int:
         return len(self._versions)
 
     def __iter__(self):
-        return iter(self.versions)
+        return iter(self._versions)
 
     def __bool__(self):
         return bool(self._versions)
@@ -258,23 +267,34 @@ class Changelog:
             ) from exc
 
     def __eq__(self, __o: object) -> bool:
-        return (
+        return self is __o or (
             isinstance(__o, Changelog)
             and self.header == __o.header
-            and self.versions == __o.versions
+            and len(self._versions) == len(__o._versions)
+            and all(mine == other for mine, other in zip(self._versions, __o._versions))
             and self.rest == __o.rest
         )
 
+    def clone(self) -> "Changelog":
+        changelog = Changelog()
+        changelog.header = self.header.copy()
+        for version in self._versions:
+            changelog.append(version.clone())
+        changelog.rest = self.rest.copy()
+        return changelog
+
     def append_top(self, version: Version):
         return self.append(version, top=True)
 
     def append(self, version: Version, top: bool = False):
-        name, reference = version.name, version.ref
-        self._validate_missing(name, reference)
-        getattr(self._versions, "appendleft" if top else "append")(version)
-        if reference:
-            self._refs[reference] = version
-        self._names[name] = version
+        self._validate_missing(version.name, version.ref)
+        if top:
+            self._versions.insert(0, version)
+        else:
+            self._versions.append(version)
+        if not version.is_released:
+            self._unreleased_count += 1
+        self._register(version)
 
     def add_entry(self, index: Union[str, int], change_type: ChangeType, entry: str):
         self[index]._add_entry(change_type, entry)
@@ -284,19 +304,28 @@ class Changelog:
     ):
         self._validate_missing(release_name, reference)
         version = self[index]
-        old_name = version.name
-        old_ref = version.ref
+        old_name, old_ref = version.name, version.ref
         version._release(release_name, reference)
-        if old_ref in self._refs:
-            del self._refs[old_ref]
-        if reference:
-            self._refs[reference] = version
-        self._names[release_name] = version
+        self._unreleased_count -= 1
+        # Names and references are separate namespaces, a key stays if still in use
         del self._names[old_name]
+        if old_name not in self._refs:
+            self._keys.discard(old_name)
+        if old_ref and self._refs.pop(old_ref, None) and old_ref not in self._names:
+            self._keys.discard(old_ref)
+        self._register(version)
 
     def yank(self, index: Union[str, int]):
         self[index]._yank()
 
+    def _register(self, version: Version):
+        name, reference = version.name, version.ref
+        if reference:
+            self._refs[reference] = version
+            self._keys.add(reference)
+        self._names[name] = version
+        self._keys.add(name)
+
     def _validate_missing(self, name: str, ref: Optional[str]):
         if name in self._names:
             raise ModelError(f"Version already exists in changelog: {name}")
@@ -320,10 +349,10 @@ class Operation(Enum):
 
     @classmethod
     def _missing_(cls, value: str):
-        return missing_enum(cls, value, lambda x: x.lower())
+        return missing_enum(cls, value, str.lower)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Config:
     """
     Stores all arguments (passed from CLI) needed to perform any action on the
@@ -3,40 +3,88 @@ Changelog Parser - This file stores whole definition on how the file should be
 structured and encoded/decoded.
 """
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from re import compile, Match  # pylint: disable=redefined-builtin
+from re import compile, escape, Match  # pylint: disable=redefined-builtin
+from sys import intern
 from typing import List, Optional, Set, Tuple
-from changelog_keeper.model import Changelog, ChangeType, ModelError, Version
+from changelog_keeper.model import Changelog, ChangeType, Version
+
+try:  # optional linear-time engine (google-re2) for the per-line patterns
+    from re2 import compile as linear_compile  # pylint: disable=import-error
+except ImportError:
+    linear_compile = compile
 
-OPEN_FILE_MODES = ("r", "w")
 FILE_ENCODING = "utf-8"
 ENDLINE_CHAR = "\n"
 
 VERSION_HEADING_PREFIX = "## "
 DATE_SEPARATOR = " - "
 DATE_INTERNAL_SEPARATOR = DATE_SEPARATOR.strip()
-DATE_FORMAT = f"%Y{DATE_INTERNAL_SEPARATOR}%m{DATE_INTERNAL_SEPARATOR}%d"
 YANKED_TAG = "YANKED"
 YANKED_SUFFIX = f"[{YANKED_TAG}]"
-VERSION_REGEX = compile(
+# Explicit classes instead of \S and \d, which are Unicode-aware in re but ASCII-only
+# in re2, so both engines accept the same lines. The characters are embedded literally
+# (the engines do not share an escape syntax for code points) and are those for which
+# str.isspace() is true, ie. what \s matches in re.
+WHITESPACE_CHARS = (
+    "\t\n\v\f\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+NON_SPACE = f"[^{WHITESPACE_CHARS}]"
+DIGIT = "[0-9]"
+VERSION_REGEX = linear_compile(
     rf"^{VERSION_HEADING_PREFIX}"
-    r"\[(?P<name>(\S*))\]"
-    r"(\((?P<ref>(\S*))\))?"
+    rf"\[(?P<name>({NON_SPACE}*))\]"
+    rf"(\((?P<ref>({NON_SPACE}*))\))?"
     rf"({DATE_SEPARATOR}"
-    rf"(?P<date>(\d\d\d\d{DATE_INTERNAL_SEPARATOR}\d\d{DATE_INTERNAL_SEPARATOR}\d\d))"
+    rf"(?P<date>({DIGIT}{{4}}{DATE_INTERNAL_SEPARATOR}{DIGIT}{{2}}"
+    rf"{DATE_INTERNAL_SEPARATOR}{DIGIT}{{2}}))"
     rf"( (\[(?P<yanked>({YANKED_TAG}))\]))?)?$"
 )
 
 CHANGE_TYPE_PREFIX = "### "
+# Exact values resolve here, others (ie. lowercase) fall back to the enum lookup
+CHANGE_TYPES_BY_VALUE = {change_type.value: change_type for change_type in ChangeType}
+# Change type sections are saved in the alphabetical order of their values
+CHANGE_TYPE_ORDER = {
+    change_type: idx
+    for idx, change_type in enumerate(sorted(ChangeType, key=lambda x: x.value))
+}
 
 ENTRY_PREFIXES = ("- ", "  ")
+# Joining entry lines with the lowest character keeps the order of tuple comparison,
+# while letting the sort compare plain strings
+ENTRY_SORT_KEY = "\0".join
+
+# Recognized lines are classified by the index of the matched group. The same single
+# match also rejects unrecognized lines, so no separate startswith() pre-check is made.
+# Prefixes are ordered from the most frequent kind of line, which is tried first.
+LINE_PREFIXES = (
+    ENTRY_PREFIXES[1],
+    ENTRY_PREFIXES[0],
+    CHANGE_TYPE_PREFIX,
+    VERSION_HEADING_PREFIX,
+)
+LINE_KIND_REGEX = compile("|".join(f"({escape(prefix)})" for prefix in LINE_PREFIXES))
+LINE_ENTRY_CONTINUATION = 1
+LINE_ENTRY = 2
+LINE_CHANGE_TYPE = 3
+LINE_VERSION_HEADING = 4
 
 UNRELEASED_ENTRY_PREFIX_FORMAT = "<{version}-{change_type}/>"
-UNRELEASED_ENTRY_PREFIX_REGEX = compile(
-    r"<(?P<version>(\S+))-(?P<change_type>(\S+))\/\>"
+UNRELEASED_ENTRY_PREFIX_REGEX = linear_compile(
+    rf"<(?P<version>({NON_SPACE}+))-(?P<change_type>({NON_SPACE}+))\/\>"
 )
 
 
+@lru_cache(maxsize=64)
+def _unreleased_entry_prefix(version_name: str, change_type_value: str) -> str:
+    return UNRELEASED_ENTRY_PREFIX_FORMAT.format(
+        version=version_name, change_type=change_type_value
+    )
+
+
 class ParserException(BaseException):
     """
     This exception indicates that the issue has been encountered during loading or
@@ -66,8 +114,9 @@ class ChangelogParser:
         If there are any invalid entries and cannot be sorted automatically,
         raises ParserException with a list of invalid lines to fix manually.
         """
-        with open(path, OPEN_FILE_MODES[0], encoding=FILE_ENCODING) as file:
-            lines = [line.replace(ENDLINE_CHAR, "") for line in file]
+        lines = path.read_text(encoding=FILE_ENCODING).split(ENDLINE_CHAR)
+        if not lines[-1]:  # the file ends with a newline (or is empty)
+            lines.pop()
 
         changelog = Changelog()
         lines = cls._load_header(lines, changelog)
@@ -101,11 +150,14 @@ class ChangelogParser:
         for version in changelog:
             cls._prepare_entries(version)
 
-        content = [cls._save_header(changelog)]
-        content.extend(cls._save_versions(changelog))
-        with open(path, OPEN_FILE_MODES[1], encoding=FILE_ENCODING) as file:
-            file.write(ENDLINE_CHAR.join(content))
-            file.write(ENDLINE_CHAR.join(changelog.rest))
+        lines = cls._save_header(changelog)
+        lines.extend(cls._save_versions(changelog))
+        if changelog.rest:
+            # rest[0] continues the last emitted line: empty after a version
+            # section, otherwise the last header line
+            lines[-1] += changelog.rest[0]
+            lines.extend(changelog.rest[1:])
+        path.write_text(ENDLINE_CHAR.join(lines), encoding=FILE_ENCODING)
 
     ###################################################################################
     ### Header
@@ -113,15 +165,21 @@ class ChangelogParser:
 
     @classmethod
     def _load_header(cls, lines: List[str], changelog: Changelog) -> List[str]:
-        for idx, line in enumerate(lines):
-            if line.startswith(VERSION_HEADING_PREFIX):
-                return lines[idx:]
-            changelog.header.append(line)
-        return []
+        first_heading = next(
+            (
+                idx
+                for idx, line in enumerate(lines)
+                if line.startswith(VERSION_HEADING_PREFIX)
+            ),
+            len(lines),
+        )
+        changelog.header.extend(lines[:first_heading])
+        return lines[first_heading:]
 
     @classmethod
-    def _save_header(cls, changelog: Changelog) -> str:
-        return ENDLINE_CHAR.join(changelog.header)
+    def _save_header(cls, changelog: Changelog) -> List[str]:
+        # Even an empty header takes the first line of the file
+        return changelog.header.copy() or [""]
 
     ###################################################################################
     ### Version
@@ -130,38 +188,49 @@ class ChangelogParser:
     @classmethod
     def _load_versions(cls, lines: List[str], changelog: Changelog) -> List[str]:
         last_recognized_line = 0
-        prefixes = (VERSION_HEADING_PREFIX, CHANGE_TYPE_PREFIX) + ENTRY_PREFIXES
 
         version: Optional[Version] = None
         change_type: Optional[ChangeType] = None
+        entry: Optional[List[str]] = None  # lines of the entry being read
+
+        # Hot loop: attributes used on every line are bound once
+        match_line_kind = LINE_KIND_REGEX.match
+        load_entry = cls._load_entry
+        continuation_prefix_length = len(ENTRY_PREFIXES[1])
 
         for idx, line in enumerate(lines):
-            if not (line and any(line.startswith(prefix) for prefix in prefixes)):
+            match = match_line_kind(line)
+            if not match:
                 continue
             last_recognized_line = idx
-            if line.startswith(VERSION_HEADING_PREFIX):
-                version: Version = cls._load_version_heading(line)
-                changelog.append(version)
+            line_kind = match.lastindex
+            continuation = line_kind == LINE_ENTRY_CONTINUATION
+            if continuation and entry is not None:
+                entry.append(line[continuation_prefix_length:])
                 continue
-            if line.startswith(CHANGE_TYPE_PREFIX):
+            if entry is not None:
+                load_entry(entry, version, change_type)
+                entry = None
+            if line_kind <= LINE_ENTRY:  # orphaned continuation starts an entry too
+                entry = [line[len(ENTRY_PREFIXES[continuation]) :]]
+            elif line_kind == LINE_CHANGE_TYPE:
                 change_type: ChangeType = cls._load_change_type(line)
-                continue
-            cls._load_entry(line, version, change_type)
+            else:
+                version: Version = cls._load_version_heading(line)
+                changelog.append(version)
 
-        for version in changelog:
-            for change_type in version.changes.keys():
-                version.changes[change_type] = {
-                    tuple(entry) for entry in version.changes[change_type]
-                }
+        if entry is not None:
+            load_entry(entry, version, change_type)
         return lines[last_recognized_line + 1 :]
 
     @classmethod
     def _save_versions(cls, changelog: Changelog) -> List[str]:
-        sections = []
+        lines = []
         for version in changelog:
-            sections.append(cls._save_version_heading(version))
-            sections.extend(cls._save_version_changes(version))
-        return sections
+            lines.append(cls._save_version_heading(version))
+            lines.append("")
+            lines.extend(cls._save_version_changes(version))
+        return lines
 
     ###################################################################################
     ### Version Heading
@@ -172,18 +241,16 @@ class ChangelogParser:
         match = VERSION_REGEX.fullmatch(line)
         if not match:
             raise ParserException(f"Cannot parse the version heading line: '{line}'")
-        params = match.groupdict()
-        name = params.get("name", None)
+        name, ref, release_date, yanked = match.group("name", "ref", "date", "yanked")
         if not name:
             raise ParserException(
                 f"Cannot parse the version name in version heading line: '{line}'"
             )
-        ref = params.get("ref", None)
-        release_date = params.get("date", None)
         if release_date:
-            release_date = datetime.strptime(release_date, DATE_FORMAT)
-        is_yanked = bool(params.get("yanked", ""))
-        return Version(name, ref, release_date, is_yanked)
+            release_date = datetime.fromisoformat(release_date)
+        is_yanked = yanked is not None
+        # Interned, so lookups of well-known names (ie. Unreleased) match by identity
+        return Version(intern(name), ref, release_date, is_yanked)
 
     @classmethod
     def _save_version_heading(cls, version: Version) -> str:
@@ -191,10 +258,10 @@ class ChangelogParser:
         if version.ref:
             heading += f"({version.ref})"
         if version.release_date:
-            heading += f"{DATE_SEPARATOR}{version.release_date.strftime(DATE_FORMAT)}"
+            heading += f"{DATE_SEPARATOR}{version.release_date.date().isoformat()}"
             if version.is_yanked:
                 heading += f" {YANKED_SUFFIX}"
-        return heading + ENDLINE_CHAR
+        return heading
 
     ###################################################################################
     ### Version Changes
@@ -202,33 +269,31 @@ class ChangelogParser:
 
     @classmethod
     def _load_change_type(cls, line: str) -> ChangeType:
-        return ChangeType(line[len(CHANGE_TYPE_PREFIX) :].strip())
+        value = line[len(CHANGE_TYPE_PREFIX) :].strip()
+        return CHANGE_TYPES_BY_VALUE.get(value) or ChangeType(value)
 
     @classmethod
-    def _load_entry(cls, line: str, version: Version, change_type: ChangeType):
-        first, continuation = (line.startswith(match) for match in ENTRY_PREFIXES)
-        entries: List[List[str]] = version.changes.setdefault(change_type, [])
-        if first or (continuation and not entries):
-            entries.append([])
-        if first or continuation:
-            entries[-1].append(line[len(ENTRY_PREFIXES[int(continuation)]) :])
+    def _load_entry(cls, entry: List[str], version: Version, change_type: ChangeType):
+        entries = version.changes.get(change_type)
+        if entries is None:
+            entries = version.changes[change_type] = set()
+        entries.add(tuple(entry))
 
     @classmethod
     def _save_version_changes(cls, version: Version) -> List[str]:
-        changes_list = []
-        keys = sorted(version.changes.keys(), key=lambda x: x.value)
+        lines = []
+        keys = sorted(version.changes, key=CHANGE_TYPE_ORDER.__getitem__)
         for change_type in keys:
             changes = version.changes[change_type]
             if not changes:
                 continue
-            changes_list.extend(
-                [f"{CHANGE_TYPE_PREFIX}{change_type.value}{ENDLINE_CHAR}", ""]
-            )
-            for change in sorted(changes):
+            lines.append(f"{CHANGE_TYPE_PREFIX}{change_type.value}")
+            lines.append("")
+            for change in sorted(changes, key=ENTRY_SORT_KEY):
                 for line_no, change_line in enumerate(change):
-                    prefix = ENTRY_PREFIXES[int(bool(line_no))]
-                    changes_list[-1] += f"{prefix}{change_line}{ENDLINE_CHAR}"
-        return changes_list
+                    lines.append(f"{ENTRY_PREFIXES[1 if line_no else 0]}{change_line}")
+            lines.append("")
+        return lines
 
     ###################################################################################
     ### Organizing entries
@@ -239,12 +304,9 @@ class ChangelogParser:
         if version.is_released:
             return
         for change_type in version.changes.keys():
-            added_content = UNRELEASED_ENTRY_PREFIX_FORMAT.format(
-                version=version.name, change_type=change_type.value
-            )
+            prepend = _unreleased_entry_prefix(version.name, change_type.value).__add__
             version.changes[change_type] = {
-                tuple(added_content + line for line in change)
-                for change in version.changes[change_type]
+                tuple(map(prepend, change)) for change in version.changes[change_type]
             }
 
     @classmethod
@@ -252,11 +314,12 @@ class ChangelogParser:
         cls, version: Version, changelog: Changelog
     ) -> Set[Tuple[str, ...]]:
         invalid_entries = set()
-        for change_type in version.changes.copy().keys():
+        for change_type in list(version.changes):
             changes = version.changes[change_type]
             to_be_removed: Set[Tuple[str, ...]] = set()
 
-            for change in changes.copy():
+            # Entries may be moved into this very set, so iterate over a snapshot
+            for change in tuple(changes):
                 to_remove, invalid_entry = cls._process_change(change, changelog)
                 if to_remove:
                     to_be_removed.add(to_remove)
@@ -273,28 +336,26 @@ class ChangelogParser:
         cls, change: Tuple[str, ...], changelog: Changelog
     ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
         invalid, found_versions, found_change_types = cls._find_matches(change)
-        if invalid or len(found_versions) != 1 or len(found_change_types) != 1:
-            return (
-                (),
-                change
-                if invalid
-                or len(found_versions) > 1
-                or len(found_change_types) > 1
-                or (found_versions and found_versions[0] not in changelog)
-                else (),
-            )
+        if invalid or len(found_versions) > 1 or len(found_change_types) > 1:
+            return (), change
+        if not found_versions:  # entry without prefixes stays where it is
+            return (), ()
 
-        try:
-            version: Version = changelog[found_versions[0]]
-            change_type = ChangeType(found_change_types[0])
-        except (ModelError, ValueError):
+        version_name = found_versions[0]
+        # Same as ChangeType(value), which falls back to the capitalized value
+        change_type = CHANGE_TYPES_BY_VALUE.get(found_change_types[0].capitalize())
+        if version_name not in changelog or change_type is None:
             return (), change
+        version: Version = changelog[version_name]
 
-        replacement_string = UNRELEASED_ENTRY_PREFIX_FORMAT.format(
-            version=version.name, change_type=change_type.value
-        )
+        # Every line was matched against the prefix at its start, so only strip it there
+        prefix = _unreleased_entry_prefix(version.name, change_type.value)
+        prefix_length = len(prefix)
         version.changes.setdefault(change_type, set()).add(
-            tuple(line.replace(replacement_string, "") for line in change)
+            tuple(
+                line[prefix_length:] if line.startswith(prefix) else line
+                for line in change
+            )
         )
         return change, ()
 
@@ -302,14 +363,17 @@ class ChangelogParser:
     def _find_matches(
         cls, change: Tuple[str, ...]
     ) -> Tuple[bool, List[Optional[str]], List[Optional[str]]]:
-        found: List[Optional[Match]] = [
-            UNRELEASED_ENTRY_PREFIX_REGEX.match(line) for line in change
-        ]
-        if not all(found):
-            return any(found), [], []
         found_versions, found_change_types = set(), set()
-        for match in found:
-            groups = match.groupdict()
-            found_versions.add(groups.get("version"))
-            found_change_types.add(groups.get("change_type"))
+        for idx, line in enumerate(change):
+            match: Optional[Match] = UNRELEASED_ENTRY_PREFIX_REGEX.match(line)
+            if not match:
+                # Partially prefixed entry is invalid, regardless which lines matched
+                invalid = bool(idx) or any(
+                    UNRELEASED_ENTRY_PREFIX_REGEX.match(rest)
+                    for rest in change[idx + 1 :]
+                )
+                return invalid, [], []
+            version, change_type = match.group("version", "change_type")
+            found_versions.add(version)
+            found_change_types.add(change_type)
         return False, list(found_versions), list(found_change_types)
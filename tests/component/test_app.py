@@ -1,12 +1,18 @@
+import subprocess
+import sys
 import pytest
 from pytest_mock import MockerFixture
 from changelog_keeper.app import App
-from changelog_keeper.model import Config, Operation
+from changelog_keeper.keeper import ChangelogKeeperError
+from changelog_keeper.model import Config, ModelError, Operation
+from changelog_keeper.parser import ParserException
+
+ERRORS = (ModelError, ParserException, ChangelogKeeperError)
 
 
 class TestApp:
     @pytest.mark.parametrize(
-        "error,code", [(error, code) for error, code in App.ERROR_CODES.items()]
+        "error,code", [(error, App.ERROR_CODES[error.__name__]) for error in ERRORS]
     )
     def test_run_internal(self, error, code, capsys, mocker: MockerFixture):
         example_error_message = "Some error occured!"
@@ -20,6 +26,17 @@ class TestApp:
         mocked_keeper = mocker.MagicMock()
         mocked_keeper.return_value.run = mocked_keeper_run
         mocker.patch("changelog_keeper.app.cli", mocked_cli)
-        mocker.patch("changelog_keeper.app.ChangelogKeeper", mocked_keeper)
+        mocker.patch("changelog_keeper.keeper.ChangelogKeeper", mocked_keeper)
         assert App([]).run() == code
-        assert App.ERROR_MSG.format(example_error_message) in capsys.readouterr().out
+        assert f"ERROR: {example_error_message}" in capsys.readouterr().out
+
+    def test_service_layer_not_imported(self):
+        code = (
+            "import sys; import changelog_keeper.app; "
+            "print('changelog_keeper.keeper' in sys.modules, "
+            "'changelog_keeper.parser' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        )
+        assert result.stdout.strip() == "False False"
@@ -1,7 +1,19 @@
+from argparse import ArgumentParser
+from dataclasses import replace
 from pathlib import Path
 import pytest
+from pytest_mock import MockerFixture
 from typing import List
-from changelog_keeper.cli import ChangeType, cli, Config, ENTRYPOINT_COMMAND, Operation
+from changelog_keeper.cli import (
+    _cli_argparse,
+    _cli_fast,
+    _parser_class,
+    ChangeType,
+    cli,
+    Config,
+    ENTRYPOINT_COMMAND,
+    Operation,
+)
 
 PROG = [ENTRYPOINT_COMMAND]
 SOME_FILE = Path("CHANGES.MD")
@@ -9,7 +21,7 @@ SOME_FILE = Path("CHANGES.MD")
 
 def _validate_cli_result(config: Config, arguments: List[str], file):
     if file:
-        config.file = file
+        config = replace(config, file=file)
         arguments.extend(["--file", str(file)])
     assert config == cli(PROG + [config.operation.value] + arguments)
 
@@ -82,3 +94,69 @@ def test_cli_release_and_yank(operation, file):
         repo_ref=None,
     )
     _validate_cli_result(config, [example_version], file)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    (
+        ["create"],
+        ["check", "-f", str(SOME_FILE)],
+        ["add", "-f", str(SOME_FILE), "FIXED", "Some entry"],
+        ["add", "added", "Some -f entry", "--file", str(SOME_FILE)],
+        ["release", "--reference", "v1.2.3", "1.2.3", "-r", "v1.2.4"],
+        ["release", "--ref", "v1.2.3", "1.2.3", "--file", "-"],
+        ["yank", "1.2.3", "-f", "A.md", "-f", str(SOME_FILE)],
+    ),
+)
+def test_cli_fast_path(arguments):
+    config = _cli_fast(arguments)
+    assert config is not None
+    assert config == _cli_argparse(PROG + arguments)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    (
+        [],
+        ["-h"],
+        ["-f", str(SOME_FILE), "check"],
+        ["create", "--file=CHANGES.md"],
+        ["create", "--fi", str(SOME_FILE)],
+        ["create", "-f"],
+        ["create", "-f", "-r"],
+        ["create", "unexpected"],
+        ["yank", "1.2.3", "-r", "v1.2.3"],
+        ["release"],
+        ["add", "Fixed"],
+        ["add", "Unknown", "Some entry"],
+        ["add", "Fixed", "-", "--", "entry"],
+        ["Create"],
+    ),
+)
+def test_cli_fast_path_fallback(arguments):
+    assert _cli_fast(arguments) is None
+
+
+@pytest.mark.parametrize("arguments", ([], ["-h"], ["add", "-h"]))
+def test_cli_help(arguments, capsys):
+    with pytest.raises(SystemExit):
+        cli(PROG + arguments)
+    assert "usage: " + ENTRYPOINT_COMMAND in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "arguments", (["create", "unexpected"], ["add", "Unknown", "Some entry"])
+)
+def test_cli_invalid(arguments, capsys):
+    with pytest.raises(SystemExit, match="2"):
+        cli(PROG + arguments)
+    assert "error: " in capsys.readouterr().err
+
+
+def test_cli_parser_reuses_validation_formatter(mocker: MockerFixture):
+    spy = mocker.spy(ArgumentParser, "_get_formatter")
+    parser = _parser_class()(ENTRYPOINT_COMMAND)
+    for option in ("-a", "-b", "-c"):
+        parser.add_argument(option)
+    assert spy.call_count == 1
+    assert "-c C" in parser.format_help()
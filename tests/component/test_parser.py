@@ -1,4 +1,3 @@
-from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 import pytest
@@ -37,13 +36,23 @@ class TestChangelogParser:
 
     def test_save_and_load(self, changelog: Changelog):
         try:
-            ChangelogParser.save(deepcopy(changelog), CHANGELOG_FILE)
+            ChangelogParser.save(changelog.clone(), CHANGELOG_FILE)
             output_changelog = ChangelogParser.load(CHANGELOG_FILE)
             assert output_changelog == changelog
         finally:
             if CHANGELOG_FILE.exists():
                 CHANGELOG_FILE.unlink()
 
+    @pytest.mark.parametrize("newline", ("\n", "\r\n"))
+    def test_load_trailing_newline(self, changelog: Changelog, newline: str):
+        content = SHUFFLED_CHANGELOG.read_text(encoding="utf-8").split("\n")
+        try:
+            CHANGELOG_FILE.write_bytes((newline.join(content) + newline).encode())
+            assert changelog == ChangelogParser.load(CHANGELOG_FILE)
+        finally:
+            if CHANGELOG_FILE.exists():
+                CHANGELOG_FILE.unlink()
+
     def test_load_shuffled(self, changelog: Changelog):
         parsed = ChangelogParser.load(SHUFFLED_CHANGELOG)
         assert changelog == parsed
@@ -0,0 +1,18 @@
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items):
+    if config.getoption("--runslow"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if "slow" in item.keywords else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -0,0 +1,12 @@
+import pytest
+from changelog_keeper import parser
+
+
+# Patterns compiled with google-re2 (when installed) are checked against the fallback
+@pytest.fixture(params=("re", "re2"))
+def regex_engine(request, monkeypatch):
+    engine = pytest.importorskip(request.param)
+    for name in ("VERSION_REGEX", "UNRELEASED_ENTRY_PREFIX_REGEX"):
+        pattern = getattr(parser, name).pattern
+        monkeypatch.setattr(parser, name, engine.compile(pattern))
+    return engine
@@ -0,0 +1,5 @@
+from datetime import datetime
+from changelog_keeper.model import ChangeType
+
+FIXED_NOW = datetime(2024, 6, 15, 12, 0, 0)
+ALL_CHANGE_TYPES = list(ChangeType)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime
 import pytest
 from changelog_keeper.keeper import (
@@ -36,6 +36,12 @@ class TestKeeper:
         changelog.append_top(Version(UNRELEASED_VERSION_NAME, None, None, False))
         return changelog
 
+    @pytest.mark.parametrize(
+        "operation", [op for op in Operation if op != Operation.CREATE]
+    )
+    def test_operation_handlers(self, keeper: ChangelogKeeper, operation: Operation):
+        assert callable(getattr(keeper, ChangelogKeeper.OPERATION_HANDLERS[operation]))
+
     def test_create(self, keeper: ChangelogKeeper, changelog: Changelog):
         assert changelog == keeper._create()
 
@@ -43,7 +49,7 @@ class TestKeeper:
     def expected_add_changelog(
         self, keeper: ChangelogKeeper, changelog: Changelog
     ) -> Changelog:
-        expected = deepcopy(changelog)
+        expected = changelog.clone()
         expected[UNRELEASED_VERSION_NAME].changes.setdefault(
             keeper.config.change_type, set()
         ).add(tuple(keeper.config.entry.split(ENDLINE_CHAR)))
@@ -62,7 +68,7 @@ class TestKeeper:
     def expected_release_changelog(
         self, keeper: ChangelogKeeper, expected_add_changelog: Changelog
     ) -> Changelog:
-        expected = deepcopy(expected_add_changelog)
+        expected = expected_add_changelog.clone()
         expected.release(
             UNRELEASED_VERSION_NAME, keeper.config.version, keeper.config.repo_ref
         )
@@ -75,7 +81,8 @@ class TestKeeper:
         expected_add_changelog: Changelog,
         expected_release_changelog: Changelog,
     ):
-        keeper.config.repo_ref = expected_release_changelog[keeper.config.version].ref
+        released = expected_release_changelog[keeper.config.version]
+        keeper.config = replace(keeper.config, repo_ref=released.ref)
         keeper._release(expected_add_changelog)
         assert expected_release_changelog == expected_add_changelog
 
@@ -83,7 +90,7 @@ class TestKeeper:
     def expected_yank_changelog(
         self, keeper: ChangelogKeeper, expected_release_changelog: Changelog
     ) -> Changelog:
-        expected = deepcopy(expected_release_changelog)
+        expected = expected_release_changelog.clone()
         expected[keeper.config.version]._yank()
         return expected
 
@@ -97,7 +104,7 @@ class TestKeeper:
         assert expected_yank_changelog == expected_release_changelog
 
     def test_check_successful(self, keeper: ChangelogKeeper, changelog: Changelog):
-        expected = deepcopy(changelog)
+        expected = changelog.clone()
         keeper._check(changelog)
         assert expected == changelog
 
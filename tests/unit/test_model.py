@@ -1,8 +1,14 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime
+from typing import Tuple
+import sys
 import pytest
+from pytest_mock import MockerFixture
 from changelog_keeper.model import (
     Changelog,
     ChangeType,
+    Config,
+    DEFAULT_CHANGELOG_PATH,
     ModelError,
     Operation,
     UNRELEASED_VERSION_NAME,
@@ -10,25 +16,27 @@ from changelog_keeper.model import (
     VersionPhase,
     VersionState,
 )
+from .constants import ALL_CHANGE_TYPES, FIXED_NOW
 
+ALL_OPERATIONS = list(Operation)
 STRING_FUNCTIONS = ("capitalize", "lower", "upper", "strip")
 
 
+def _mutated(value: str) -> Tuple[str, ...]:
+    return tuple(getattr(value, function)() for function in STRING_FUNCTIONS)
+
+
 class TestChangeType:
-    @pytest.mark.parametrize("value", list(ChangeType))
-    @pytest.mark.parametrize("function", STRING_FUNCTIONS)
-    def test_valid(self, value: ChangeType, function: str):
-        str_value = value.value
-        str_value = getattr(str_value, function)()
-        assert value == ChangeType(str_value)
-
-    @pytest.mark.parametrize("value", list(ChangeType))
-    @pytest.mark.parametrize("function", STRING_FUNCTIONS)
-    def test_invalid(self, value: ChangeType, function: str):
-        str_value = value.value
-        str_value = getattr(str_value, function)()[:4]
-        with pytest.raises(ValueError):
-            ChangeType(str_value)
+    @pytest.mark.parametrize("value", ALL_CHANGE_TYPES)
+    def test_valid(self, value: ChangeType):
+        for str_value in _mutated(value.value):
+            assert value == ChangeType(str_value)
+
+    @pytest.mark.parametrize("value", ALL_CHANGE_TYPES)
+    def test_invalid(self, value: ChangeType):
+        for str_value in _mutated(value.value):
+            with pytest.raises(ValueError):
+                ChangeType(str_value[:4])
 
 
 class TestVersionPhase:
@@ -46,8 +54,8 @@ class TestVersionState:
         (
             (None, False, VersionPhase.UNRELEASED, False),
             (None, True, VersionPhase.YANKED, True),
-            (datetime.now(), False, VersionPhase.RELEASED, False),
-            (datetime.now(), True, VersionPhase.YANKED, False),
+            (FIXED_NOW, False, VersionPhase.RELEASED, False),
+            (FIXED_NOW, True, VersionPhase.YANKED, False),
         ),
     )
     def test_init(self, name, ref, release_date, is_yanked, phase, should_fail):
@@ -62,17 +70,36 @@ class TestVersionState:
         assert state.release_date == release_date
         assert state.phase == phase
 
+    def test_eq(self):
+        state = VersionState("1.0.0", "v1.0.0", FIXED_NOW, False)
+        # Only the date part is stored in the file, so the time is not compared
+        assert state == VersionState("1.0.0", "v1.0.0", datetime(2024, 6, 15), False)
+        assert state != VersionState("1.0.0", "v1.0.0", datetime(2024, 6, 16), False)
+        assert state != VersionState("1.0.0", "v1.0.0", FIXED_NOW, True)
+        assert state != VersionState("1.0.0", None, FIXED_NOW, False)
+        assert state != VersionState("1.0.1", "v1.0.0", FIXED_NOW, False)
+        assert state != VersionState("1.0.0", "v1.0.0", None, False)
+
     @pytest.mark.parametrize("old_ref", (None, "old_ref"))
     @pytest.mark.parametrize("new_ref", (None, "new_ref"))
     @pytest.mark.parametrize(
         "release_date,is_yanked,should_fail",
         (
             (None, False, False),
-            (datetime.now(), False, True),
-            (datetime.now(), True, True),
+            (FIXED_NOW, False, True),
+            (FIXED_NOW, True, True),
         ),
     )
-    def test_release(self, old_ref, release_date, is_yanked, new_ref, should_fail):
+    def test_release(
+        self,
+        old_ref,
+        release_date,
+        is_yanked,
+        new_ref,
+        should_fail,
+        mocker: MockerFixture,
+    ):
+        mocker.patch("changelog_keeper.model.datetime").now.return_value = FIXED_NOW
         new_version = "version.name"
         state = VersionState("old.name", old_ref, release_date, is_yanked)
         if should_fail:
@@ -86,14 +113,14 @@ class TestVersionState:
         assert state.name == new_version
         assert state.ref == new_ref
         assert state.phase == VersionPhase.RELEASED
-        assert state.release_date.date() == datetime.now().date()
+        assert state.release_date == FIXED_NOW
 
     @pytest.mark.parametrize(
         "release_date,is_yanked,should_fail",
         (
             (None, False, True),
-            (datetime.now(), False, False),
-            (datetime.now(), True, False),
+            (FIXED_NOW, False, False),
+            (FIXED_NOW, True, False),
         ),
     )
     def test_yank(self, release_date, is_yanked, should_fail):
@@ -108,7 +135,13 @@ class TestVersionState:
 
 
 class TestVersion:
-    def test_init_and_state(self):
+    def test_slots(self):
+        version = Version("name", None, None, False)
+        assert not hasattr(version, "__dict__")
+        assert not hasattr(version._state, "__dict__")
+
+    def test_init_and_state(self, mocker: MockerFixture):
+        mocker.patch("changelog_keeper.model.datetime").now.return_value = FIXED_NOW
         version = Version("name", None, None, False)
         assert not version.changes
         assert version.ref is None
@@ -120,23 +153,20 @@ class TestVersion:
         version._release("new_name", "new_ref")
         assert version.name == "new_name"
         assert version.ref == "new_ref"
-        assert (
-            isinstance(version.release_date, datetime)
-            and version.release_date.date() == datetime.now().date()
-        )
+        assert version.release_date == FIXED_NOW
         assert version.is_released
         assert not version.is_yanked
         version._yank()
         assert version.is_released
         assert version.is_yanked
 
-    @pytest.mark.parametrize("change_type", list(ChangeType))
+    @pytest.mark.parametrize("change_type", ALL_CHANGE_TYPES)
     @pytest.mark.parametrize(
         "release_date,is_yanked,should_fail",
         (
             (None, False, False),
-            (datetime.now(), False, True),
-            (datetime.now(), True, True),
+            (FIXED_NOW, False, True),
+            (FIXED_NOW, True, True),
         ),
     )
     def test_add_entry(self, change_type, release_date, is_yanked, should_fail):
@@ -156,25 +186,55 @@ class TestVersion:
                 version._add_entry(change, entry)
         assert version.changes == expected_changes
 
+    @pytest.mark.parametrize(
+        "release_date,is_yanked", ((None, False), (FIXED_NOW, False), (FIXED_NOW, True))
+    )
+    def test_clone(self, release_date, is_yanked):
+        version = Version("some.version", "some.ref", release_date, is_yanked)
+        version.changes[ChangeType.ADDED] = {("Some multiline", "entry")}
+        clone = version.clone()
+        assert clone == version and clone is not version
+        clone.changes[ChangeType.ADDED].add(("Another entry",))
+        clone.ref = "other.ref"
+        assert version.changes == {ChangeType.ADDED: {("Some multiline", "entry")}}
+        assert version.ref == "some.ref"
+
+
+def _append(changelog: Changelog, name: str, ref):
+    changelog.append(Version(name, ref, None, False))
+
+
+def _append_top(changelog: Changelog, name: str, ref):
+    changelog.append_top(Version(name, ref, None, False))
+
+
+def _release(changelog: Changelog, name: str, ref):
+    changelog.append_top(Version(UNRELEASED_VERSION_NAME, None, None, False))
+    changelog.release(UNRELEASED_VERSION_NAME, name, ref)
+
 
 class TestChangelog:
     @pytest.mark.parametrize("index", (UNRELEASED_VERSION_NAME, 9))
     @pytest.mark.parametrize(
-        "function,args",
+        "operation",
         (
-            ("add_entry", [ChangeType.CHANGED, "Some entry"]),
-            ("release", ["release_name", None]),
-            ("yank", []),
+            pytest.param(
+                lambda cl, idx: cl.add_entry(idx, ChangeType.CHANGED, "Some entry"),
+                id="add_entry",
+            ),
+            pytest.param(
+                lambda cl, idx: cl.release(idx, "release_name", None), id="release"
+            ),
+            pytest.param(lambda cl, idx: cl.yank(idx), id="yank"),
         ),
     )
-    def test_init(self, index, function, args):
+    def test_init(self, index, operation):
         changelog = Changelog()
         assert index not in changelog
         assert not changelog
         assert len(changelog) == 0
-        arguments = [index] + args
         with pytest.raises(ModelError, match="Version is not present in the changelog"):
-            getattr(changelog, function)(*arguments)
+            operation(changelog, index)
 
         changelog.append_top(Version(str(index), None, None, False))
         assert str(index) in changelog
@@ -182,46 +242,19 @@ class TestChangelog:
         assert len(changelog) == 1
         assert changelog[str(index)] == changelog[0]
 
-    @pytest.mark.parametrize("function", ("append", "append_top"))
     @pytest.mark.parametrize(
-        "existing_name,existing_ref,name,ref,error_msg",
+        "insert",
         (
-            (
-                UNRELEASED_VERSION_NAME,
-                None,
-                UNRELEASED_VERSION_NAME,
-                None,
-                "Version already exists in changelog",
-            ),
-            (
-                UNRELEASED_VERSION_NAME,
-                "some_ref1",
-                "new_version",
-                "some_ref1",
-                "Version link already exists in changelog",
-            ),
+            pytest.param(_append, id="append"),
+            pytest.param(_append_top, id="append_top"),
+            pytest.param(_release, id="release"),
         ),
     )
-    def test_append_already_existing(
-        self, function, existing_name, existing_ref, name, ref, error_msg
-    ):
-        changelog = Changelog()
-        getattr(changelog, function)(Version(existing_name, existing_ref, None, False))
-        with pytest.raises(ModelError, match=error_msg):
-            getattr(changelog, function)(Version(name, ref, None, False))
-
     @pytest.mark.parametrize(
-        "existing_name,existing_ref,name,ref,error_msg",
+        "existing_ref,name,ref,error_msg",
         (
+            (None, "0.0.1", None, "Version already exists in changelog"),
             (
-                "0.0.1",
-                None,
-                "0.0.1",
-                None,
-                "Version already exists in changelog",
-            ),
-            (
-                "0.0.1",
                 "some_ref1",
                 "new_version",
                 "some_ref1",
@@ -229,15 +262,11 @@ class TestChangelog:
             ),
         ),
     )
-    def test_release_already_existing(
-        self, existing_name, existing_ref, name, ref, error_msg
-    ):
+    def test_already_existing(self, insert, existing_ref, name, ref, error_msg):
         changelog = Changelog()
-        changelog.append(Version(UNRELEASED_VERSION_NAME, None, None, False))
-        changelog.release(UNRELEASED_VERSION_NAME, existing_name, existing_ref)
-        changelog.append_top(Version(UNRELEASED_VERSION_NAME, None, None, False))
+        insert(changelog, "0.0.1", existing_ref)
         with pytest.raises(ModelError, match=error_msg):
-            changelog.release(UNRELEASED_VERSION_NAME, name, ref)
+            insert(changelog, name, ref)
 
     def test_release(self):
         changelog = Changelog()
@@ -261,19 +290,89 @@ class TestChangelog:
         assert "https://github.com/me/my-project/releases/tag/HEAD" not in changelog
         assert "https://github.com/me/my-project/releases/tag/v1.0.0" in changelog
 
+    def test_eq(self):
+        changelog, other = Changelog(), Changelog()
+        for instance in (changelog, other):
+            instance.append(Version(UNRELEASED_VERSION_NAME, None, None, False))
+        assert changelog == other
+        assert list(changelog) == list(other.versions)
+        other.append(Version("1.0.0", None, FIXED_NOW, False))
+        assert changelog != other
+        changelog.append(Version("0.1.0", None, FIXED_NOW, False))
+        assert changelog != other
+
+    def test_clone(self):
+        changelog = Changelog()
+        changelog.header = ["# Changelog"]
+        changelog.append(Version("1.0.0", "v1.0.0", FIXED_NOW, False))
+        changelog.append_top(Version(UNRELEASED_VERSION_NAME, None, None, False))
+        changelog.add_entry(UNRELEASED_VERSION_NAME, ChangeType.FIXED, ("Entry",))
+        changelog.rest = ["", "Footer"]
+        clone = changelog.clone()
+        assert clone == changelog
+        assert clone.unreleased_count == changelog.unreleased_count
+        assert "v1.0.0" in clone
+        clone.release(UNRELEASED_VERSION_NAME, "2.0.0", None)
+        clone.header.append("Header line")
+        clone.rest.append("Footer line")
+        assert changelog[UNRELEASED_VERSION_NAME].changes[ChangeType.FIXED]
+        assert changelog.unreleased_count == 1
+        assert changelog.header == ["# Changelog"]
+        assert changelog.rest == ["", "Footer"]
+
+    def test_release_name_used_as_reference(self):
+        changelog = Changelog()
+        released = Version("1.0.0", UNRELEASED_VERSION_NAME, FIXED_NOW, False)
+        changelog.append(released)
+        changelog.append_top(Version(UNRELEASED_VERSION_NAME, "HEAD", None, False))
+        changelog.release(UNRELEASED_VERSION_NAME, "2.0.0", None)
+        assert UNRELEASED_VERSION_NAME in changelog
+        assert changelog[UNRELEASED_VERSION_NAME].name == "1.0.0"
+        assert "HEAD" not in changelog
+        assert "2.0.0" in changelog
+
+    def test_release_with_old_name_as_reference(self):
+        changelog = Changelog()
+        changelog.append(Version(UNRELEASED_VERSION_NAME, "HEAD", None, False))
+        changelog.release(UNRELEASED_VERSION_NAME, "HEAD", UNRELEASED_VERSION_NAME)
+        assert changelog[UNRELEASED_VERSION_NAME] is changelog["HEAD"]
+        assert changelog["HEAD"].ref == UNRELEASED_VERSION_NAME
+
+    def test_unreleased_count(self):
+        changelog = Changelog()
+        assert changelog.unreleased_count == 0
+        changelog.append(Version("1.0.0", None, FIXED_NOW, False))
+        changelog.append(Version("0.0.1", None, FIXED_NOW, True))
+        assert changelog.unreleased_count == 0
+        changelog.append_top(Version(UNRELEASED_VERSION_NAME, None, None, False))
+        changelog.append_top(Version("Unreleased2", None, None, False))
+        assert changelog.unreleased_count == 2
+        changelog.release("Unreleased2", "2.0.0", None)
+        assert changelog.unreleased_count == 1
+        changelog.yank("2.0.0")
+        assert changelog.unreleased_count == 1
+        with pytest.raises(ModelError):
+            changelog.release("1.0.0", "3.0.0", None)
+        assert changelog.unreleased_count == 1
+
 
 class TestOperation:
-    @pytest.mark.parametrize("value", list(Operation))
-    @pytest.mark.parametrize("function", STRING_FUNCTIONS)
-    def test_valid(self, value: Operation, function: str):
-        str_value = value.value
-        str_value = getattr(str_value, function)()
-        assert value == Operation(str_value)
-
-    @pytest.mark.parametrize("value", list(Operation))
-    @pytest.mark.parametrize("function", STRING_FUNCTIONS)
-    def test_invalid(self, value: Operation, function: str):
-        str_value = value.value
-        str_value = getattr(str_value, function)()[:2]
-        with pytest.raises(ValueError):
-            Operation(str_value)
+    @pytest.mark.parametrize("value", ALL_OPERATIONS)
+    def test_valid(self, value: Operation):
+        for str_value in _mutated(value.value):
+            assert value == Operation(str_value)
+
+    @pytest.mark.parametrize("value", ALL_OPERATIONS)
+    def test_invalid(self, value: Operation):
+        for str_value in _mutated(value.value):
+            with pytest.raises(ValueError):
+                Operation(str_value[:2])
+
+
+class TestConfig:
+    def test_frozen(self):
+        config = Config(Operation.CHECK, None, None, None, None)
+        assert config.file == DEFAULT_CHANGELOG_PATH
+        with pytest.raises(FrozenInstanceError):
+            config.file = None
+        assert hasattr(config, "__dict__") == (sys.version_info < (3, 10))
@@ -0,0 +1,125 @@
+import pytest
+from changelog_keeper.parser import (
+    Changelog,
+    ChangelogParser,
+    ChangeType,
+    UNRELEASED_ENTRY_PREFIX_FORMAT,
+    Version,
+)
+from .constants import ALL_CHANGE_TYPES, FIXED_NOW
+
+
+def _prefix(version: str, change_type: str) -> str:
+    return UNRELEASED_ENTRY_PREFIX_FORMAT.format(
+        version=version, change_type=change_type
+    )
+
+
+class TestChangelogParser:
+    def test_entries(self):
+        changelog = Changelog()
+        lines = [
+            "## [Unreleased]",
+            "### Added",
+            "  Orphaned continuation",
+            "- First",
+            "",
+            "  entry",
+            "Unrecognized line",
+            "- Second entry",
+            "### Fixed",
+            "- Third",
+            "  entry",
+        ]
+        assert not ChangelogParser._load_versions(lines, changelog)
+        assert changelog[0].changes == {
+            ChangeType.ADDED: {
+                ("Orphaned continuation",),
+                ("First", "entry"),
+                ("Second entry",),
+            },
+            ChangeType.FIXED: {("Third", "entry")},
+        }
+
+    def test_entries_order(self):
+        version = Version("Unreleased", None, None, False)
+        version.changes[ChangeType.ADDED] = {
+            ("b",),
+            ("a\tb",),
+            ("a", "c"),
+            ("a",),
+            ("a", "b"),
+        }
+        assert ChangelogParser._save_version_changes(version) == [
+            "### Added",
+            "",
+            "- a",
+            "- a",
+            "  b",
+            "- a",
+            "  c",
+            "- a\tb",
+            "- b",
+            "",
+        ]
+
+    @pytest.mark.parametrize("change_type", ALL_CHANGE_TYPES)
+    @pytest.mark.usefixtures("regex_engine")
+    def test_find_matches(self, change_type):
+        VERSION = "UNRELEASED"
+        prefix = _prefix(VERSION, change_type.value)
+
+        single_line = ("Single line entry",)
+        multi_line = ("Multi line", "entry")
+        assert (False, [], []) == ChangelogParser._find_matches(single_line)
+        assert (False, [], []) == ChangelogParser._find_matches(multi_line)
+
+        single_line = (prefix + single_line[0],)
+        assert (False, [VERSION], [change_type.value]) == ChangelogParser._find_matches(
+            single_line
+        )
+
+        multi_line_only_first = (prefix + multi_line[0], multi_line[1])
+        assert (True, [], []) == ChangelogParser._find_matches(multi_line_only_first)
+
+        multi_line_only_second = (multi_line[0], prefix + multi_line[1])
+        assert (True, [], []) == ChangelogParser._find_matches(multi_line_only_second)
+
+        multi_line = (prefix + multi_line[0], prefix + multi_line[1])
+        assert (False, [VERSION], [change_type.value]) == ChangelogParser._find_matches(
+            multi_line
+        )
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "release_date,is_yanked",
+        ((None, False), (FIXED_NOW, False), (FIXED_NOW, True)),
+    )
+    @pytest.mark.parametrize("change_type", ALL_CHANGE_TYPES)
+    @pytest.mark.parametrize(
+        "entry",
+        (
+            ("Single line entry",),
+            ("Multiline", "entry"),
+        ),
+    )
+    def test_prepare_entries(self, release_date, is_yanked, change_type, entry):
+        self._check_prepare_entries(release_date, is_yanked, change_type, entry)
+
+    @pytest.mark.parametrize("release_date", (None, FIXED_NOW))
+    def test_prepare_entries_sample(self, release_date):
+        self._check_prepare_entries(
+            release_date, False, ChangeType.ADDED, ("Multiline", "entry")
+        )
+
+    def _check_prepare_entries(self, release_date, is_yanked, change_type, entry):
+        version = Version("1.2.3", None, release_date, is_yanked)
+        version.changes.setdefault(change_type, {entry})
+        prefix = "" if version.is_released else _prefix(version.name, change_type.value)
+        expected_changes = {
+            k: {tuple(prefix + line for line in entry) for entry in v}
+            for k, v in version.changes.items()
+        }
+
+        ChangelogParser._prepare_entries(version)
+        assert expected_changes == version.changes
@@ -0,0 +1,66 @@
+from sys import intern
+import pytest
+from changelog_keeper.parser import (
+    Changelog,
+    ChangelogParser,
+    ENDLINE_CHAR,
+    ParserException,
+    Version,
+)
+from .constants import FIXED_NOW
+
+
+class TestChangelogParser:
+    def test_header(self):
+        example_header = ["# Changelog", "Some header content"]
+        changelog = Changelog()
+        output_changelog_1 = Changelog()
+        output_changelog_2 = Changelog()
+
+        changelog.header = example_header
+        dumped = ChangelogParser._save_header(changelog)
+        rest = ChangelogParser._load_header(dumped, output_changelog_1)
+        assert not rest
+        assert changelog.header == output_changelog_1.header
+        assert ChangelogParser._save_header(Changelog()) == [""]
+
+        example_header = example_header + ["## [Unreleased](HEAD)"]
+        rest = ChangelogParser._load_header(example_header, output_changelog_2)
+        assert rest == example_header[-1:]
+        assert output_changelog_2.header == changelog.header
+
+    @pytest.mark.parametrize("name", ("Unreleased", "1.0.0"))
+    @pytest.mark.parametrize("ref", (None, "v1.0.0"))
+    @pytest.mark.parametrize(
+        "release_date,is_yanked",
+        (
+            (None, False),
+            (FIXED_NOW, False),
+            (FIXED_NOW, True),
+        ),
+    )
+    @pytest.mark.usefixtures("regex_engine")
+    def test_version_heading_success(self, name, ref, release_date, is_yanked):
+        version = Version(name, ref, release_date, is_yanked)
+        dumped = ChangelogParser._save_version_heading(version)
+        assert ENDLINE_CHAR not in dumped
+        parsed_version = ChangelogParser._load_version_heading(dumped)
+        assert version == parsed_version
+        assert parsed_version.name is intern(name)
+
+    @pytest.mark.parametrize(
+        "line,match",
+        (
+            ("Some random line", "Cannot parse the version heading line"),
+            ("## []()", "Cannot parse the version name in version heading line"),
+            ("## [1.0\u00a0rc]", "Cannot parse the version heading line"),
+            (
+                "## [1.0] - \u0662\u0660\u0662\u0664-01-01",
+                "Cannot parse the version heading line",
+            ),
+        ),
+    )
+    @pytest.mark.usefixtures("regex_engine")
+    def test_version_heading_failed(self, line, match):
+        with pytest.raises(ParserException, match=match):
+            ChangelogParser._load_version_heading(line)
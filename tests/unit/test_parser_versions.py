@@ -0,0 +1,88 @@
+import pytest
+from changelog_keeper.parser import (
+    Changelog,
+    ChangelogParser,
+    ChangeType,
+    Version,
+)
+from .constants import ALL_CHANGE_TYPES, FIXED_NOW
+
+ALL_CHANGE_TYPES_OR_NONE = ALL_CHANGE_TYPES + [None]
+
+
+def _canonical_changes(version: Version):
+    # Empty change types are not written, so they cannot be read back either
+    return {
+        change_type: set(map(tuple, entries))
+        for change_type, entries in version.changes.items()
+        if entries
+    }
+
+
+class TestChangelogParser:
+    @pytest.mark.slow
+    @pytest.mark.parametrize("change_type", ALL_CHANGE_TYPES)
+    @pytest.mark.parametrize("entries", (set(), {("Single line",), ("Multi", "line")}))
+    def test_version_changes(self, change_type, entries):
+        self._check_version_changes(change_type, entries)
+
+    @pytest.mark.parametrize("entries", (set(), {("Single line",), ("Multi", "line")}))
+    def test_version_changes_sample(self, entries):
+        self._check_version_changes(ChangeType.ADDED, entries)
+
+    def _check_version_changes(self, change_type, entries):
+        version = Version("Unreleased", None, None, False)
+        output_changelog = Changelog()
+        version.changes[change_type] = entries
+
+        reloaded = [ChangelogParser._save_version_heading(version)]
+        reloaded.extend(ChangelogParser._save_version_changes(version))
+
+        if entries:
+            assert ChangelogParser._load_change_type(reloaded[1]) == change_type
+        ChangelogParser._load_versions(reloaded, output_changelog)
+
+        output_version = output_changelog[0]
+        assert output_version.name == version.name
+        assert _canonical_changes(output_version) == _canonical_changes(version)
+
+    @pytest.mark.parametrize(
+        "ref", (None, "https://github.com/me/my-project/releases/tag/v1.0.0")
+    )
+    @pytest.mark.parametrize(
+        "release_date,is_yanked",
+        ((None, False), (FIXED_NOW, False), (FIXED_NOW, True)),
+    )
+    def test_versions_state(self, ref, release_date, is_yanked):
+        version = Version("SOME_VERSION", ref, release_date, is_yanked)
+        version.changes.setdefault(ChangeType.CHANGED, {("Single line entry",)})
+        self._check_versions_round_trip(version)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("change_type", ALL_CHANGE_TYPES_OR_NONE)
+    @pytest.mark.parametrize(
+        "entry",
+        (
+            ("Single line entry",),
+            ("Multiline", "entry"),
+        ),
+    )
+    def test_versions_changes(self, change_type, entry):
+        version = Version("SOME_VERSION", None, FIXED_NOW, False)
+        if change_type:
+            version.changes.setdefault(change_type, {entry})
+        self._check_versions_round_trip(version)
+
+    def test_versions_changes_sample(self):
+        version = Version("SOME_VERSION", None, FIXED_NOW, False)
+        version.changes.setdefault(ChangeType.FIXED, {("Multiline", "entry")})
+        self._check_versions_round_trip(version)
+
+    def _check_versions_round_trip(self, version: Version):
+        input_changelog = Changelog()
+        output_changelog = Changelog()
+        input_changelog.append(version)
+
+        reloaded = ChangelogParser._save_versions(input_changelog)
+        assert [""] == ChangelogParser._load_versions(reloaded, output_changelog)
+        assert input_changelog == output_changelog